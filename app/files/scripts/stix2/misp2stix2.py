@@ -32,6 +32,10 @@ sys.path.insert(3, str(_scripts_path / 'mixbox'))
 sys.path.insert(4, str(_scripts_path / 'misp-stix'))
 from stix2.base import STIXJSONEncoder
 from misp_stix_converter import MISPtoSTIX20Parser, MISPtoSTIX21Parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def _handle_messages(field: str, feature: dict):
@@ -45,6 +49,40 @@ def _handle_messages(field: str, feature: dict):
         )
 
 
+def _write_stix_objects(filename: str, stix_objects: list):
+    # STIX objects are encoded and written one at a time, so the whole
+    # bundle content is never held in memory as a single string
+    if orjson is None:
+        encoder = STIXJSONEncoder()
+        with open(filename, 'wt', encoding='utf-8') as f:
+            f.write('[')
+            for index, stix_object in enumerate(stix_objects):
+                if index:
+                    f.write(', ')
+                f.write(encoder.encode(stix_object))
+            f.write(']')
+        return
+    # Datetime values are passed through to the STIX encoder so they keep the
+    # STIX timestamp format instead of the orjson native one
+    encoder = STIXJSONEncoder()
+    with open(filename, 'wb') as f:
+        f.write(b'[')
+        for index, stix_object in enumerate(stix_objects):
+            if index:
+                f.write(b',')
+            try:
+                content = orjson.dumps(
+                    stix_object, default=encoder.default,
+                    option=orjson.OPT_PASSTHROUGH_DATETIME
+                )
+            except orjson.JSONEncodeError:
+                # orjson does not handle some values the stdlib json module
+                # does, like integers exceeding 64 bits
+                content = encoder.encode(stix_object).encode('utf-8')
+            f.write(content)
+        f.write(b']')
+
+
 def _process_misp_files(
         version: str, input_names: Union[list, None], debug: bool):
     if input_names is None:
@@ -54,10 +92,7 @@ def _process_misp_files(
         parser = MISPtoSTIX20Parser() if version == '2.0' else MISPtoSTIX21Parser()
         for name in input_names:
             parser.parse_json_content(name)
-            with open(f'{name}.out', 'wt', encoding='utf-8') as f:
-                f.write(
-                    json.dumps(parser.stix_objects, cls=STIXJSONEncoder)
-                )
+            _write_stix_objects(f'{name}.out', parser.stix_objects)
         if parser.errors:
             _handle_messages('Errors', parser.errors)
         if debug and parser.warnings: